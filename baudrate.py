@@ -1,49 +1,100 @@
 #!/usr/bin/env python
 
+import os
 import sys
+import bisect
 import time
+import codecs
+import select
 import serial
-from threading import Thread
-
-class RawInput:
-    """Gets a single character from standard input.  Does not echo to the screen."""
-    def __init__(self):
-        try:
-            self.impl = RawInputWindows()
-        except ImportError:
-            self.impl = RawInputUnix()
-
-    def __call__(self): return self.impl()
+from threading import Thread, Event
 
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import tty
+    import termios
+    import selectors
 
 class RawInputUnix:
     def __init__(self):
-        import tty, sys
-
-    def __call__(self):
-        import sys, tty, termios
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        self.fd = sys.stdin.fileno()
+        self.old_settings = termios.tcgetattr(self.fd)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.fd, selectors.EVENT_READ)
+
+    def __enter__(self):
+        # Stay raw for the whole session: in cooked mode between reads a key would
+        # be echoed, and Ctrl-C would raise SIGINT instead of being read
+        tty.setraw(self.fd, termios.TCSANOW)
+        # setraw() also turns off output processing, which the display relies on
+        mode = termios.tcgetattr(self.fd)
+        mode[tty.OFLAG] = self.old_settings[tty.OFLAG]
+        termios.tcsetattr(self.fd, termios.TCSANOW, mode)
+        return self
+
+    def __exit__(self, *exc_info):
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self.old_settings)
+
+    def __call__(self, timeout=None):
+        # Read the fd directly, as bytes held in sys.stdin's buffer are invisible to select
+        if not self.selector.select(timeout):
+            return None
+        data = os.read(self.fd, 1)
+        ch = self.decoder.decode(data)
+        while data and not ch:  # The rest of a multi-byte character
+            data = os.read(self.fd, 1)
+            ch = self.decoder.decode(data)
         return ch
 
 
 class RawInputWindows:
     def __init__(self):
-        import msvcrt
-
-    def __call__(self):
-        import msvcrt
-        return msvcrt.getch()
+        # getwch() returns str like the Unix reader; getch() returns bytes
+        self.getch = msvcrt.getwch
+        self.kbhit = msvcrt.kbhit
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def __call__(self, timeout=None):
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            while not self.kbhit():
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.01)
+        return self.getch()
+
+
+# Gets a single character from standard input.  Does not echo to the screen.
+# Returns None if no character arrives within the timeout, when one is given.
+# Reads must happen inside a with block, which keeps the terminal raw throughout.
+RawInput = RawInputWindows if sys.platform == 'win32' else RawInputUnix
+
+def _class_table(*classes):
+    """Builds a 256 entry table holding, for each byte value, the OR of the
+    flags of the (flag, bytes) classes the byte belongs to."""
+    table = bytearray(256)
+    for flag, members in classes:
+        for byte in members:
+            table[byte] |= flag
+    return bytes(table)
 
 class Baudrate:
 
     VERSION = '1.0'
     READ_TIMEOUT = 5
+    READ_CHUNK_SIZE = 4096
+    POLL_INTERVAL = 0.05
+    KEY_POLL_INTERVAL = 0.1
+    KEY_WRITE_SIZE = 64
+    # pyserial ports on Windows have no selectable file descriptor
+    CAN_SELECT = hasattr(select, 'select') and sys.platform != 'win32'
     BAUDRATES = [
             "921600",
             "576000",
@@ -70,6 +121,9 @@ class Baudrate:
             "50",
     ]
 
+    BAUDRATES_INT = [int(rate) for rate in BAUDRATES]
+    BAUDRATE_INDEX = {rate: index for index, rate in enumerate(BAUDRATES_INT)}
+
     MAX_LEN = len(max(BAUDRATES, key=len))
 
     DEFAULT_BAUDRATE = "115200"
@@ -81,6 +135,7 @@ class Baudrate:
     ESCAPE_KEY = '\x1b'
     ESCAPE_CODE_COMING = '[' # e.g. ESC + this + A == up arrow
     INTERPRET_ESC_TIMEOUT_MS = 100
+    INTERPRET_ESC_TIMEOUT_NS = INTERPRET_ESC_TIMEOUT_MS * 1_000_000
 
     UPKEYS = ['u', 'U', 'A']
     DOWNKEYS = ['d', 'D', 'B']
@@ -88,10 +143,32 @@ class Baudrate:
     RETURN = ['\n', '\r']
 
     MIN_CHAR_COUNT = 25
+    # This many consecutive invalid bytes move auto detect on without waiting for the timeout
+    MAX_INVALID_RUN = 32
+    INVALID_RUN = bytes(MAX_INVALID_RUN)
     WHITESPACE = [' ', '\t', '\r', '\n']
     PUNCTUATION = ['.', ',', ':', ';', '?', '!']
     VOWELS = ['a', 'A', 'e', 'E', 'i', 'I', 'o', 'O', 'u', 'U']
 
+    # The serial port delivers bytes, so classify against bytes rather than str
+    WHITESPACE_BYTES = ''.join(WHITESPACE).encode('ascii')
+    PUNCTUATION_BYTES = ''.join(PUNCTUATION).encode('ascii')
+    VOWEL_BYTES = ''.join(VOWELS).encode('ascii')
+    VALID_BYTES = bytes(range(0x20, 0x7f)) + WHITESPACE_BYTES
+
+    # Bit flags stored per byte value in the classification table
+    CLS_VALID = 1
+    CLS_WHITESPACE = 2
+    CLS_PUNCTUATION = 4
+    CLS_VOWEL = 8
+    CLS_TABLE = _class_table((CLS_VALID, VALID_BYTES),
+                             (CLS_WHITESPACE, WHITESPACE_BYTES),
+                             (CLS_PUNCTUATION, PUNCTUATION_BYTES),
+                             (CLS_VOWEL, VOWEL_BYTES))
+
+    # Character, whitespace, punctuation and vowel counts of a run
+    NO_COUNTS = (0, 0, 0, 0)
+
     def __init__(self, port=None, threshold=MIN_CHAR_COUNT, timeout=READ_TIMEOUT, name=None, auto=True, verbose=False, allow_newline=False, passthrough_keys=False, toggle_baud=DEFAULT_BAUDRATE):
         self.port = port
         self.threshold = threshold
@@ -99,157 +176,269 @@ class Baudrate:
         self.name = name
         self.auto_detect = auto
         self.verbose = verbose
-        self.index = self.BAUDRATES.index(self.DEFAULT_BAUDRATE)
-        self.valid_characters = []
-        self.ctlc = False
+        self.index = self.BAUDRATE_INDEX[int(self.DEFAULT_BAUDRATE)]
+        self.stop_evt = Event()
         self.thread = None
-        self.buffer = ""
+        self.buf_parts = []
+        self.buf_len = 0
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
         self.max_display_chars = 80 # The widespread 80 column archaism should be fine
         self.newline_sub = f"\r{' ' * self.max_display_chars}\r"
         self.stderr_needs_capping = False
         self.allow_newline = allow_newline
         self.passthrough_keys = passthrough_keys
-        index = self.BAUDRATES.index(toggle_baud)
+        index = self.BAUDRATE_INDEX[int(toggle_baud)]
         self.toggle_bauds = (index, index)
+        self._status_lines = [f"\r@@@@@@@@@@@@@@@@@@@@@ Baudrate: {rate:>{self.MAX_LEN}} @@@@@@@@@@@@@@@@@@@@@" for rate in self.BAUDRATES]
+        self._set_active_indices(list(range(len(self.BAUDRATES))))
 
-        self._gen_char_list()
+    def cap_stderr(self):
+        sys.stderr.write('\n\n')
+        self.stderr_needs_capping = False
 
-    def _gen_char_list(self):
-        c = ' '
+    def _write_buffer(self, line_done=False):
+        if self.stderr_needs_capping:
+            self.cap_stderr()
 
-        while c <= '~':
-            self.valid_characters.append(c)
-            c = chr(ord(c) + 1)
+        out = ''.join(self.buf_parts)
+        # Reprint from the start, as the beginning of the line may already be on screen
+        sys.stderr.write(f"\r{out}")
 
-        for c in self.WHITESPACE:
-            if c not in self.valid_characters:
-                self.valid_characters.append(c)
+        # Once written the line is cleared, so reprinting it must not clear what follows
+        if out.startswith(self.newline_sub):
+            out = out[len(self.newline_sub):]
+            self.buf_len -= len(self.newline_sub)
 
-    def cap_stderr(self):
-        sys.stderr.write('\n\n')
-        self.stderr_needs_capping = False
+        if self.buf_len >= self.max_display_chars or line_done:
+            self.buf_parts = []
+            self.buf_len = 0
+        else:
+            self.buf_parts = [out]
 
     def _print(self, data, allow_newline=False):
         if self.verbose:
             try:
-                buf = data.decode('utf-8')
-                reprinting = True
+                # A chunk may end part way through a multi-byte character
+                buf = self.decoder.decode(data)
+                nl = buf.rfind('\n')
                 if allow_newline or self.allow_newline:
-                    if '\n' in buf:
-                        reprinting = False
-                    self.buffer += buf
+                    if nl >= 0:
+                        # Text up to the last newline goes out as is; what follows is the line still being built
+                        self.buf_parts.append(buf[:nl + 1])
+                        self._write_buffer(line_done=True)
+                        buf = buf[nl + 1:]
+                        if not buf:
+                            return
+                    self.buf_parts.append(buf)
+                    self.buf_len += len(buf)
+                elif nl >= 0:
+                    # Show the line the last newline ends, as byte at a time output would.
+                    # Blank lines are skipped, as a newline only clears the display once
+                    # more text follows it
+                    head = buf[:nl].rstrip('\r\n')
+                    if head:
+                        pos = head.rfind('\n')
+                        line = head[pos + 1:].strip('\r')
+                        if pos >= 0:
+                            self.buf_parts = [self.newline_sub]
+                            self.buf_len = len(self.newline_sub)
+                        self.buf_parts.append(line)
+                        self.buf_len += len(line)
+                        self._write_buffer()
+
+                    # Whatever follows the newline starts a fresh line
+                    buf = buf[nl + 1:].strip('\r')
+                    self.buf_parts = [self.newline_sub, buf]
+                    self.buf_len = len(self.newline_sub) + len(buf)
+                    if not buf:
+                        return  # Don't leave a blank line
                 else:
-                    if '\n' in buf:
-                        if '\n' == buf:  # Just a newline char
-                            self.buffer = self.newline_sub
-                            return  # Don't leave a blank line
-                        else:  #  Embedded newline(s)
-                            buf = buf.strip()  # Don't leave a blank line
-                            if '\n' in buf:
-                                pos = buf.rfind('\n')
-                                self.buffer = self.newline_sub + buf[pos + 1:]
-                            else:
-                                self.buffer = buf
-                    else:
-                        self.buffer += buf
-
-                if self.stderr_needs_capping:
-                    self.cap_stderr()
+                    self.buf_parts.append(buf)
+                    self.buf_len += len(buf)
 
-                prefix = '\r' if reprinting else ""
-                sys.stderr.write(f"{prefix}{self.buffer}")
-
-                if len(self.buffer) >= self.max_display_chars or not prefix:
-                    self.buffer = ""
+                self._write_buffer()
             except:
                 pass
 
     def Open(self):
-        self.serial = serial.Serial(self.port, timeout=self.timeout)
+        if self.CAN_SELECT:
+            # Detect() waits in select() and reads the descriptor itself, so the port never needs to block
+            self.serial = serial.Serial(self.port, timeout=0)
+            self._rawfd = self.serial.fileno()
+        else:
+            self.serial = serial.Serial(self.port, timeout=self.timeout)
+        self._probe_baudrates()
         self.NextBaudrate(0)
 
+    def _set_active_indices(self, indices):
+        # NextBaudrate() steps through these, starting from the current baudrate or the next one down
+        self.active_indices = indices
+        self.active_positions = {index: pos for pos, index in enumerate(indices)}
+        self.position = bisect.bisect_left(indices, self.index) % len(indices)
+
+    def _probe_baudrates(self):
+        # Leave the baudrates the port refuses out of the scan, rather than
+        # sitting out the timeout at each of them on every pass
+        supported = []
+        for index, rate in enumerate(self.BAUDRATES_INT):
+            try:
+                self.serial.baudrate = rate
+            except (ValueError, serial.SerialException):
+                continue
+            supported.append(index)
+
+        if supported:
+            self._set_active_indices(supported)
+
     def set_baud_from_index(self, index=None):
-        self.index = index if index else self.index
+        if index is not None:
+            self.index = index
+        self.position = self.active_positions.get(self.index, self.position)
 
         if not self.stderr_needs_capping:
             sys.stderr.write('\n\n')
             self.stderr_needs_capping = True
 
-        sys.stderr.write(f"\r@@@@@@@@@@@@@@@@@@@@@ Baudrate: {self.BAUDRATES[self.index]:>{Baudrate.MAX_LEN}} @@@@@@@@@@@@@@@@@@@@@")
+        sys.stderr.write(self._status_lines[self.index])
 
+        # Let pending passthrough keys go out at the old baudrate; returns at once when nothing was sent
         self.serial.flush()
-        self.serial.baudrate = self.BAUDRATES[self.index]
-        self.serial.flush()
+        self.serial.baudrate = self.BAUDRATES_INT[self.index]
+
+        # Discard anything received at the previous baudrate
+        try:
+            self.serial.reset_input_buffer()
+        except AttributeError:
+            self.serial.flushInput()
 
     def NextBaudrate(self, updn):
 
-        self.index -= updn
+        self.position = (self.position - updn) % len(self.active_indices)
+
+        self.set_baud_from_index(self.active_indices[self.position])
+
+    def _read_chunk(self):
+        if self.CAN_SELECT:
+            # Wait in short slices so that a Ctrl-C from the keypress thread is noticed promptly
+            ready, _, _ = select.select([self._rawfd], [], [], self.POLL_INTERVAL)
+            if not ready:
+                return b''
+            try:
+                chunk = os.read(self._rawfd, self.READ_CHUNK_SIZE)
+            except BlockingIOError:
+                return b''
+            if not chunk:
+                # Same as pyserial's own read(): readable but empty means the device has gone
+                raise serial.SerialException('device reports readiness to read but returned no data '
+                                             '(device disconnected or multiple access on port?)')
+            return chunk
+
+        # Block for the first byte, then drain whatever else has already arrived
+        chunk = self.serial.read(1)
+        if chunk:
+            waiting = self.serial.in_waiting
+            if waiting:
+                chunk += self.serial.read(min(waiting, self.READ_CHUNK_SIZE - 1))
+        return chunk
+
+    def _detected(self, counts):
+        count, whitespace, punctuation, vowels = counts
+        return count >= self.threshold and whitespace > 0 and punctuation > 0 and vowels > 0
+
+    def _count_run(self, counts, run):
+        # run only holds the flags of valid bytes, and the classes are disjoint
+        count, whitespace, punctuation, vowels = counts
+        return (count + len(run),
+                whitespace + run.count(self.CLS_VALID | self.CLS_WHITESPACE),
+                punctuation + run.count(self.CLS_VALID | self.CLS_PUNCTUATION),
+                vowels + run.count(self.CLS_VALID | self.CLS_VOWEL))
+
+    def _classify(self, chunk, counts, invalid_run):
+        """Updates the counters of the current run of valid characters, and the number of
+        consecutive invalid bytes, with the bytes in chunk. Returns the new counters, the
+        new invalid byte count and whether the detection criteria were met. The invalid
+        byte count is MAX_INVALID_RUN when the chunk held a run that long anywhere."""
+        # Translating through the table turns every byte into its flags, so invalid
+        # bytes become NULs and splitting on them leaves the runs of valid characters
+        flags = chunk.translate(self.CLS_TABLE)
+
+        # A run of invalid bytes may carry on from the previous chunk
+        trailing = len(flags) - len(flags.rstrip(b'\0'))
+        if trailing == len(flags):
+            invalid_run += trailing
+        elif (invalid_run + len(flags) - len(flags.lstrip(b'\0')) >= self.MAX_INVALID_RUN
+                or self.INVALID_RUN in flags):
+            invalid_run = self.MAX_INVALID_RUN
+        else:
+            invalid_run = trailing
+
+        runs = flags.split(b'\0')
+
+        # The first run carries on from the previous chunk
+        counts = self._count_run(counts, runs[0])
+        if self._detected(counts):
+            return counts, invalid_run, True
+        if len(runs) == 1:
+            return counts, invalid_run, False
 
-        if self.index >= len(self.BAUDRATES):
-            self.index = 0
-        elif self.index < 0:
-            self.index = len(self.BAUDRATES) - 1
+        # Only the runs between invalid bytes long enough to reach the threshold can match
+        threshold = self.threshold
+        for run in runs[1:-1]:
+            if len(run) >= threshold:
+                run_counts = self._count_run(self.NO_COUNTS, run)
+                if self._detected(run_counts):
+                    return run_counts, invalid_run, True
 
-        self.set_baud_from_index()
+        # The last run is carried on by the next chunk
+        counts = self._count_run(self.NO_COUNTS, runs[-1])
+        return counts, invalid_run, self._detected(counts)
 
     def Detect(self):
-        count = 0
-        whitespace = 0
-        punctuation = 0
-        vowels = 0
-        start_time = 0
+        counts = self.NO_COUNTS
+        invalid_run = 0
         timed_out = False
-        clear_counters = False
+        auto_detect = self.auto_detect
+        mono = time.monotonic
+        read = self._read_chunk
+        classify = self._classify
+        _print = self._print
+        stop_evt = self.stop_evt
 
         if not self.auto_detect:
             self.thread = Thread(None, self.HandleKeypress, None, (self, 1))
             self.thread.start()
 
-        while True:
-            if start_time == 0:
-                start_time = time.time()
+        deadline = mono() + self.timeout
 
-            byte = self.serial.read(1)
+        while True:
+            chunk = read()
 
-            if byte:
-                if self.auto_detect and byte in self.valid_characters:
-                    if byte in self.WHITESPACE:
-                        whitespace += 1
-                    elif byte in self.PUNCTUATION:
-                        punctuation += 1
-                    elif byte in self.VOWELS:
-                        vowels += 1
+            if chunk:
+                detected = False
 
-                    count += 1
-                else:
-                    clear_counters = True
+                if auto_detect:
+                    counts, invalid_run, detected = classify(chunk, counts, invalid_run)
 
-                self._print(byte)
+                _print(chunk)
 
-                if count >= self.threshold and whitespace > 0 and punctuation > 0 and vowels > 0:
+                if detected:
                     break
-                elif (time.time() - start_time) >= self.timeout:
+                elif invalid_run >= self.MAX_INVALID_RUN or mono() >= deadline:
                     timed_out = True
-            else:
+            elif mono() >= deadline:
                 timed_out = True
 
-            if timed_out and self.auto_detect:
-                start_time = 0
+            if timed_out and auto_detect:
                 self.NextBaudrate(-1)
-                clear_counters = True
+                counts = self.NO_COUNTS
+                invalid_run = 0
                 timed_out = False
+                deadline = mono() + self.timeout
 
-            if clear_counters:
-                whitespace = 0
-                punctuation = 0
-                vowels = 0
-                count = 0
-                clear_counters = False
-
-            if self.ctlc:
+            if stop_evt.is_set():
                 break
 
-        self._print("\n", allow_newline=True)
+        self._print(b"\n", allow_newline=True)
         return self.BAUDRATES[self.index]
 
     def toggle_baud(self):
@@ -261,60 +450,76 @@ class Baudrate:
         self.toggle_bauds = (next_index, prev_index)
 
     def HandleKeypress(self, *args):
-        userinput = RawInput()
+        with RawInput() as userinput:
+            interpret_mode = not self.passthrough_keys
 
-        interpret_mode = not self.passthrough_keys
+            interpret_esc_timeout = 0
 
-        interpret_esc_timeout = 0
+            out_buf = bytearray()
 
-        while not self.ctlc:
-            c = userinput()
+            while not self.stop_evt.is_set():
+                # With keys waiting to be sent, e.g. part way through a paste, only
+                # check for more input before sending them
+                c = userinput(0 if out_buf else self.KEY_POLL_INTERVAL)
+                if c is None:
+                    self._send_keys(out_buf)
+                    continue
 
-            # The Escape value has been detected, and that could indicate:
-            #    exit interpret_mode
-            # or
-            #    if within the timeout period it MAY be followed by a value indicating an escape code
-            if interpret_esc_timeout:
-                now =  time.time() * 1000
-                if now < interpret_esc_timeout:
-                    if c == self.ESCAPE_CODE_COMING:
-                        interpret_mode = True
-                        interpret_esc_timeout = 0
+                # The Escape value has been detected, and that could indicate:
+                #    exit interpret_mode
+                # or
+                #    if within the timeout period it MAY be followed by a value indicating an escape code
+                if interpret_esc_timeout:
+                    if time.monotonic_ns() < interpret_esc_timeout:
+                        if c == self.ESCAPE_CODE_COMING:
+                            interpret_mode = True
+                            interpret_esc_timeout = 0
+                            continue
+                    interpret_esc_timeout = 0
+
+                if self.passthrough_keys and not interpret_mode:
+                    passthrough = True
+                    if c == self.INTERPRET_MODE_KEY:
+                        if not interpret_mode:
+                            # Queue the keys before any baudrate change, whose flush() drains them at the old rate
+                            self._send_keys(out_buf)
+                            interpret_mode = True;
+                            continue
+
+                    if passthrough:
+                        out_buf += c.encode('utf-8')
+                        if len(out_buf) >= self.KEY_WRITE_SIZE:
+                            self._send_keys(out_buf)
+
+                if interpret_mode:
+                    if c in self.UPKEYS:
+                        self.NextBaudrate(1)
+                    elif c in self.DOWNKEYS:
+                        self.NextBaudrate(-1)
+                    elif c in self.HELPKEYS:
+                        self.help_keys()
+                    elif c == ' ':
+                        self.toggle_baud()
+                    elif c in self.RETURN:
+                        if self.stderr_needs_capping:
+                            self.cap_stderr()
+                        sys.stderr.write('\n')
+                    elif c == self.CONTROL_C:
+                        self.stop_evt.set()
+                    elif c == self.ESCAPE_KEY and self.passthrough_keys:
+                        interpret_esc_timeout = time.monotonic_ns() + self.INTERPRET_ESC_TIMEOUT_NS
+                        interpret_mode = False
                         continue
-                interpret_esc_timeout = 0
 
-            if self.passthrough_keys and not interpret_mode:
-                passthrough = True
-                if c == self.INTERPRET_MODE_KEY:
-                    if not interpret_mode:
-                        interpret_mode = True;
-                        continue
+                    if self.passthrough_keys:
+                        interpret_mode = False
 
-                if passthrough:
-                    self.serial.write(bytes(c, 'UTF-8'))
-
-            if interpret_mode:
-                if c in self.UPKEYS:
-                    self.NextBaudrate(1)
-                elif c in self.DOWNKEYS:
-                    self.NextBaudrate(-1)
-                elif c in self.HELPKEYS:
-                    self.help_keys()
-                elif c == ' ':
-                    self.toggle_baud()
-                elif c in self.RETURN:
-                    if self.stderr_needs_capping:
-                        self.cap_stderr()
-                    sys.stderr.write('\n')
-                elif c == self.CONTROL_C:
-                    self.ctlc = True
-                elif c == self.ESCAPE_KEY and self.passthrough_keys:
-                    interpret_esc_timeout = time.time() * 1000 + self.INTERPRET_ESC_TIMEOUT_MS
-                    interpret_mode = False
-                    continue
+            self._send_keys(out_buf)
 
-                if self.passthrough_keys:
-                    interpret_mode = False
+    def _send_keys(self, out_buf):
+        if out_buf:
+            self.serial.write(bytes(out_buf))
+            out_buf.clear()
 
     def prefix_char(self):
         return chr(ord('A') + ord(self.INTERPRET_MODE_KEY[0]) - 1)
@@ -340,19 +545,22 @@ class Baudrate:
         if name is None:
             name = self.name
 
-        config =  "########################################################################\n"
-        config += "# Minicom configuration file - use \"minicom -s\" to change parameters.\n"
-        config += "pu port             %s\n" % self.port
-        config += "pu baudrate         %s\n" % self.BAUDRATES[self.index]
-        config += "pu bits             8\n"
-        config += "pu parity           N\n"
-        config += "pu stopbits         1\n"
-        config += "pu rtscts           No\n"
-        config += "########################################################################\n"
+        config = f"""\
+########################################################################
+# Minicom configuration file - use "minicom -s" to change parameters.
+pu port             {self.port}
+pu baudrate         {self.BAUDRATES[self.index]}
+pu bits             8
+pu parity           N
+pu stopbits         1
+pu rtscts           No
+########################################################################
+"""
 
         if name is not None and name:
             try:
-                open("/etc/minicom/minirc.%s" % name, "w").write(config)
+                with open("/etc/minicom/minirc.%s" % name, "w") as f:
+                    f.write(config)
             except Exception as e:
                 if self.stderr_needs_capping:
                     self.cap_stderr()
@@ -362,7 +570,9 @@ class Baudrate:
         return (success, config)
 
     def Close(self):
-        self.ctlc = True
+        self.stop_evt.set()
+        if self.thread is not None:
+            self.thread.join()
         self.serial.close()
 
 
@@ -448,8 +658,8 @@ if __name__ == '__main__':
             elif opt == '-T':
                 toggle_baud = arg
                 try:
-                    index = Baudrate.BAUDRATES.index(toggle_baud)
-                except ValueError:
+                    index = Baudrate.BAUDRATE_INDEX[int(toggle_baud)]
+                except (KeyError, ValueError):
                     display_baudrates(f"Can't find '{toggle_baud}' baud in list:")
                     sys.exit(1)
             else:
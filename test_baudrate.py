@@ -0,0 +1,65 @@
+import io
+import sys
+
+import pytest
+
+pytest.importorskip("serial")
+
+import baudrate
+
+
+def render(output):
+    """Returns the lines left on screen by output written to a terminal."""
+    lines = [[]]
+    col = 0
+    for c in output:
+        if c == '\r':
+            col = 0
+        elif c == '\n':
+            lines.append([])
+            col = 0
+        else:
+            lines[-1][col:col + 1] = [c]
+            col += 1
+    return '\n'.join(''.join(line).rstrip() for line in lines).strip('\n')
+
+
+def display(chunks, **kwargs):
+    baud = baudrate.Baudrate(verbose=True, **kwargs)
+    stderr = sys.stderr
+    sys.stderr = io.StringIO()
+    try:
+        for chunk in chunks:
+            baud._print(chunk)
+        return sys.stderr.getvalue()
+    finally:
+        sys.stderr = stderr
+
+
+@pytest.mark.parametrize("chunks", [
+    [b"hello world\n", b"second line\n", b"third"],
+    [b"hello world\r\n", b"second line\r\n"],
+    [b"one\ntwo\nthree"],
+    [b"one\n\n\ntwo\n\n"],
+    [b"\n", b"abc", b"\n", b"\n"],
+    [b"part", b"ial\nline", b" end"],
+    [b"abc\nfoo", b"bar", b"\n"],
+    [b"boot ok\nlogin", b": "],
+])
+@pytest.mark.parametrize("allow_newline", [False, True])
+def test_chunks_display_like_single_bytes(chunks, allow_newline):
+    data = b"".join(chunks)
+    single_bytes = [data[i:i + 1] for i in range(len(data))]
+    assert render(display(chunks, allow_newline=allow_newline)) == \
+        render(display(single_bytes, allow_newline=allow_newline))
+
+
+def test_newline_at_end_of_chunk_clears_the_line():
+    output = display([b"hello world\n", b"second line\n", b"third"])
+    assert render(output) == "third"
+    assert "second linethird" not in output
+
+
+def test_newline_inside_chunk_keeps_what_follows():
+    output = display([b"abc\nfoo", b"bar", b"\n"], allow_newline=True)
+    assert render(output) == "abc\nfoobar"